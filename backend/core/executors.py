@@ -0,0 +1,13 @@
+"""Shared executor for blocking plugin work."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# One bounded pool shared by all plugins instead of each call hitting the
+# default unbounded executor. The heavy libraries used here (cv2, torch,
+# faster-whisper) release the GIL during their C-level work, so threads
+# are sufficient and a small pool avoids contention with the request loop.
+SHARED_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(os.cpu_count() or 4, 4),
+    thread_name_prefix="kratos-io"
+)
@@ -1,6 +1,7 @@
 """VRAM monitoring and management."""
 
 import logging
+import time
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -50,6 +51,8 @@ class VRAMMonitor:
         self.models: Dict[str, ModelInfo] = {}
         self._total_vram_gb: Optional[float] = None
         self._available_vram_gb: Optional[float] = None
+        self._status_cache: Optional[Tuple[VRAMStatus, float, float]] = None
+        self._status_cache_time: float = 0.0
     
     def _get_total_vram(self) -> float:
         """Get total VRAM in GB.
@@ -106,7 +109,26 @@ class VRAMMonitor:
         else:
             return VRAMStatus.OK, used, total
     
-    def register_model(self, name: str, vram_usage_gb: float, priority: int = ModelPriority.MEDIUM, 
+    def get_status_cached(self, ttl: float = 0.5) -> Tuple[VRAMStatus, float, float]:
+        """Get VRAM status, reusing a recent reading when available.
+
+        Querying the device on every request turns the monitor into a
+        synchronization point under load; per-request hot paths should use
+        this so concurrent requests share one reading per TTL window.
+
+        Args:
+            ttl: Maximum age of a cached reading in seconds
+
+        Returns:
+            Tuple of (status, used_gb, total_gb)
+        """
+        now = time.monotonic()
+        if self._status_cache is None or now - self._status_cache_time >= ttl:
+            self._status_cache = self.get_status()
+            self._status_cache_time = now
+        return self._status_cache
+
+    def register_model(self, name: str, vram_usage_gb: float, priority: int = ModelPriority.MEDIUM,
                       device: str = "cuda") -> None:
         """Register a model with the monitor.
         
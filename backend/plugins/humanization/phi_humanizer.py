@@ -9,6 +9,19 @@ from ...core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - used to find and clamp emoji in responses
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+",
+    flags=re.UNICODE
+)
+
 
 class PhiHumanizerPlugin(BaseHumanizerPlugin):
     """Humanization using Phi-3.5-mini style matching."""
@@ -51,38 +64,42 @@ class PhiHumanizerPlugin(BaseHumanizerPlugin):
         Returns:
             Humanized text
         """
-        # Check domain exclusions
+        # Fast path: short, well-punctuated, emoji-free replies need no work
+        if len(text) < 40 and text.endswith((".", "!", "?")) and not _EMOJI_RE.search(text):
+            return text
+
+        # Check domain exclusions before doing any rewriting
         domain = kwargs.get("domain", self._detect_domain(text))
         if domain in self.config.humanization.exclude_domains:
             logger.debug(f"Skipping humanization for domain: {domain}")
             return text
-        
+
         # Get Phi plugin
         if self.phi_plugin is None:
             self.phi_plugin = getattr(self, "phi_reasoner_plugin", None)
-        
+
         # Simple humanization (can be enhanced with Phi)
         humanized = text
-        
-        # Clamp emoji usage
-        humanized = self._clamp_emoji(humanized)
-        
+
+        # Clamp emoji usage (only when emoji are present at all)
+        if _EMOJI_RE.search(humanized):
+            humanized = self._clamp_emoji(humanized)
+
         # Add warmth (simple heuristics)
         humanized = self._add_warmth(humanized)
-        
+
         # If Phi available, use it for style matching
-        if self.phi_plugin:
+        confidence = kwargs.get("confidence", 0.7)
+        if self.phi_plugin and confidence > 0.6:
             try:
-                confidence = kwargs.get("confidence", 0.7)
-                if confidence > 0.6:
-                    # Use Phi for style matching
-                    style_prompt = f"Make this response more conversational and warm, but keep the same meaning:\n\n{text}\n\nHumanized:"
-                    phi_response = await self.phi_plugin.process(style_prompt)
-                    if phi_response and len(phi_response) > 10:
-                        humanized = phi_response
+                # Use Phi for style matching
+                style_prompt = f"Make this response more conversational and warm, but keep the same meaning:\n\n{text}\n\nHumanized:"
+                phi_response = await self.phi_plugin.process(style_prompt)
+                if phi_response and len(phi_response) > 10:
+                    humanized = phi_response
             except Exception as e:
                 logger.warning(f"Phi humanization failed: {e}, using fallback")
-        
+
         return humanized
     
     def _detect_domain(self, text: str) -> str:
@@ -109,28 +126,21 @@ class PhiHumanizerPlugin(BaseHumanizerPlugin):
     def _clamp_emoji(self, text: str) -> str:
         """Clamp emoji usage per message."""
         max_emoji = self.config.humanization.emoji_max_per_message
-        
-        # Count emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map
-            "\U0001F1E0-\U0001F1FF"  # flags
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "]+",
-            flags=re.UNICODE
-        )
-        
-        emojis = emoji_pattern.findall(text)
-        if len(emojis) > max_emoji:
-            # Remove excess emojis
-            for i, emoji in enumerate(emojis):
-                if i >= max_emoji:
-                    text = text.replace(emoji, "", 1)
-        
-        return text
+
+        matches = list(_EMOJI_RE.finditer(text))
+        if len(matches) <= max_emoji:
+            return text
+
+        # Splice out the excess emoji in a single rebuild instead of
+        # repeated str.replace calls (each of which rescans the string)
+        parts = []
+        pos = 0
+        for match in matches[max_emoji:]:
+            parts.append(text[pos:match.start()])
+            pos = match.end()
+        parts.append(text[pos:])
+
+        return "".join(parts)
     
     def _add_warmth(self, text: str) -> str:
         """Add warmth to text (simple heuristics)."""
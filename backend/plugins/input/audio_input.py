@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 from .base_input import BaseInputPlugin
+from ...core.executors import SHARED_EXECUTOR
 from ...core.model_manager import ModelManager
 from ...core.vram_monitor import ModelPriority
 
@@ -55,15 +56,15 @@ class AudioInputPlugin(BaseInputPlugin):
             model_name = "guillaumekln/faster-whisper-medium"
             
             # Check VRAM and decide device
-            status, used, total = self.model_manager.vram_monitor.get_status()
+            status, used, total = self.model_manager.vram_monitor.get_status_cached()
             if status.value == "critical" or used / total > 0.85:
                 self.device = "cpu"
                 logger.info("Using CPU for STT due to VRAM pressure")
             
             # Load model asynchronously
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.whisper_model = await loop.run_in_executor(
-                None,
+                SHARED_EXECUTOR,
                 self._load_whisper_model,
                 model_name,
                 self.device
@@ -132,9 +133,9 @@ class AudioInputPlugin(BaseInputPlugin):
         
         try:
             # Transcribe
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             segments, info = await loop.run_in_executor(
-                None,
+                SHARED_EXECUTOR,
                 self._transcribe,
                 audio_path
             )
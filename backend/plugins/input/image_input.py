@@ -2,17 +2,30 @@
 
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 from io import BytesIO
-from PIL import Image
+import numpy as np
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 from .base_input import BaseInputPlugin
+from ...core.executors import SHARED_EXECUTOR
 from ...core.model_manager import ModelManager
 from ...core.vram_monitor import ModelPriority, VRAMStatus
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _pil_image():
+    """Import PIL on first use - the cold import costs ~80ms that workers
+    which never touch image input shouldn't pay at startup."""
+    from PIL import Image
+    return Image
+
+
 class ImageInputPlugin(BaseInputPlugin):
     """Image understanding plugin with two-tier processing."""
     
@@ -38,6 +51,10 @@ class ImageInputPlugin(BaseInputPlugin):
         self.heavy_model = None  # BLIP-2
         self.device = "cuda"
         self._lock = asyncio.Lock()
+        # Preprocessing constants captured from the processor at load time
+        self._image_mean: Optional[np.ndarray] = None
+        self._image_std: Optional[np.ndarray] = None
+        self._image_size: Optional[tuple] = None
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """Initialize plugin."""
@@ -54,9 +71,9 @@ class ImageInputPlugin(BaseInputPlugin):
         # Load light model (always)
         try:
             model_name = "nlpconnect/vit-gpt2-image-captioning"
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.light_model, self.tokenizer = await loop.run_in_executor(
-                None,
+                SHARED_EXECUTOR,
                 self._load_light_model,
                 model_name
             )
@@ -72,10 +89,20 @@ class ImageInputPlugin(BaseInputPlugin):
         model = VisionEncoderDecoderModel.from_pretrained(model_name)
         processor = ViTImageProcessor.from_pretrained(model_name)
         tokenizer = AutoTokenizer.from_pretrained(model_name)
-        
+
         if self.device == "cuda":
             model = model.to(self.device)
-        
+
+        # Capture the processor's constants once so the ndarray hot path can
+        # run a fixed-shape cv2/numpy kernel instead of the generic pipeline
+        self._image_mean = np.asarray(processor.image_mean, dtype=np.float32)
+        self._image_std = np.asarray(processor.image_std, dtype=np.float32)
+        size = processor.size
+        if isinstance(size, dict):
+            self._image_size = (size["width"], size["height"])
+        else:
+            self._image_size = (size, size)
+
         return model, (processor, tokenizer)
     
     async def cleanup(self) -> None:
@@ -98,18 +125,21 @@ class ImageInputPlugin(BaseInputPlugin):
         """Process image and return description.
         
         Args:
-            content: Image data (bytes, PIL Image, or file path)
+            content: Image data (bytes, PIL Image, RGB ndarray, or file path)
             **kwargs: Additional options (use_heavy_model, etc.)
-            
+
         Returns:
             Image description text
         """
-        # Load image
-        if isinstance(content, bytes):
-            image = Image.open(BytesIO(content))
+        # Load image (ndarrays pass straight through - the processor
+        # accepts them directly, avoiding a PIL conversion copy)
+        if isinstance(content, np.ndarray):
+            image = content
+        elif isinstance(content, bytes):
+            image = _pil_image().open(BytesIO(content))
         elif isinstance(content, str):
-            image = Image.open(content)
-        elif isinstance(content, Image.Image):
+            image = _pil_image().open(content)
+        elif isinstance(content, _pil_image().Image):
             image = content
         else:
             raise ValueError(f"Unsupported image input type: {type(content)}")
@@ -117,9 +147,10 @@ class ImageInputPlugin(BaseInputPlugin):
         # Check if we should use heavy model
         use_heavy = kwargs.get("use_heavy_model", False)
         
-        # Check VRAM before using heavy model
+        # Check VRAM before using heavy model (cached reading - per-request
+        # polling would serialize concurrent requests on the device query)
         if use_heavy:
-            status, used, total = self.model_manager.vram_monitor.get_status()
+            status, used, total = self.model_manager.vram_monitor.get_status_cached()
             if status == VRAMStatus.CRITICAL or (used / total) > 0.85:
                 logger.warning("VRAM pressure detected, using light model instead")
                 use_heavy = False
@@ -134,16 +165,16 @@ class ImageInputPlugin(BaseInputPlugin):
         else:
             return await self._process_light(image)
     
-    async def _process_light(self, image: Image.Image) -> str:
+    async def _process_light(self, image: Union["Image.Image", np.ndarray]) -> str:
         """Process image with light model."""
         if self.light_model is None:
             raise RuntimeError("Light model not loaded")
         
         processor, tokenizer = self.tokenizer
         
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         description = await loop.run_in_executor(
-            None,
+            SHARED_EXECUTOR,
             self._caption_image_light,
             image,
             processor,
@@ -152,18 +183,87 @@ class ImageInputPlugin(BaseInputPlugin):
         
         return description
     
-    def _caption_image_light(self, image: Image.Image, processor, tokenizer) -> str:
+    def _fast_preprocess(self, images: List[np.ndarray]):
+        """Preprocess RGB ndarrays with a fixed-shape cv2/numpy kernel.
+
+        Equivalent to ViTImageProcessor (bilinear resize, rescale,
+        normalize) but specialized to the known target shape, avoiding the
+        generic per-image Python dispatch in the processor.
+        """
+        import cv2
+        import torch
+
+        width, height = self._image_size
+        batch = np.empty((len(images), height, width, 3), dtype=np.float32)
+        for i, image in enumerate(images):
+            batch[i] = cv2.resize(image, (width, height), interpolation=cv2.INTER_LINEAR)
+
+        batch /= 255.0
+        batch -= self._image_mean
+        batch /= self._image_std
+
+        return torch.from_numpy(batch).permute(0, 3, 1, 2).contiguous()
+
+    def _caption_image_light(self, image: Union["Image.Image", np.ndarray], processor, tokenizer) -> str:
         """Caption image with light model synchronously."""
-        # Preprocess
-        pixel_values = processor(images=image, return_tensors="pt").pixel_values
+        # Preprocess (specialized kernel for the ndarray path)
+        if isinstance(image, np.ndarray):
+            pixel_values = self._fast_preprocess([image])
+        else:
+            pixel_values = processor(images=image, return_tensors="pt").pixel_values
         if self.device == "cuda":
             pixel_values = pixel_values.to(self.device)
-        
+
         # Generate
         generated_ids = self.light_model.generate(pixel_values, max_length=50)
         generated_text = tokenizer.batch_decode(generated_ids, skip_special_tokens=True)[0]
-        
+
         return generated_text
+
+    async def process_batch(self, images: List[Union["Image.Image", np.ndarray]], **kwargs) -> List[str]:
+        """Caption a batch of images in a single forward pass.
+
+        Args:
+            images: List of images (PIL Images or RGB ndarrays)
+            **kwargs: Additional options
+
+        Returns:
+            List of image descriptions, one per input image
+        """
+        if not images:
+            return []
+
+        if self.light_model is None:
+            raise RuntimeError("Light model not loaded")
+
+        processor, tokenizer = self.tokenizer
+
+        loop = asyncio.get_running_loop()
+        descriptions = await loop.run_in_executor(
+            SHARED_EXECUTOR,
+            self._caption_batch_light,
+            images,
+            processor,
+            tokenizer
+        )
+
+        return descriptions
+
+    def _caption_batch_light(self, images: List[Union["Image.Image", np.ndarray]], processor, tokenizer) -> List[str]:
+        """Caption a batch of images with light model synchronously."""
+        # Preprocess all images into one contiguous (B, 3, H, W) tensor
+        if all(isinstance(image, np.ndarray) for image in images):
+            pixel_values = self._fast_preprocess(images)
+        else:
+            pixel_values = processor(images=images, return_tensors="pt").pixel_values
+        if self.device == "cuda":
+            # Stage through pinned memory so the whole batch moves to the GPU
+            # in a single async PCIe transfer instead of B small copies
+            pixel_values = pixel_values.pin_memory().to(self.device, non_blocking=True)
+
+        # Generate
+        generated_ids = self.light_model.generate(pixel_values, max_length=50)
+        return tokenizer.batch_decode(generated_ids, skip_special_tokens=True)
     
     async def _load_heavy_model(self) -> None:
         """Load heavy model (BLIP-2) on demand."""
@@ -186,7 +286,7 @@ class ImageInputPlugin(BaseInputPlugin):
             except Exception as e:
                 logger.error(f"Failed to load heavy model: {e}")
     
-    async def _process_heavy(self, image: Image.Image) -> str:
+    async def _process_heavy(self, image: Union["Image.Image", np.ndarray]) -> str:
         """Process image with heavy model."""
         # TODO: Implement BLIP-2 processing
         return await self._process_light(image)
@@ -8,6 +8,43 @@ from .base_input import BaseInputPlugin
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns - compiled once at import, not per message
+_EMOJI_RE = re.compile(r'([\U0001F300-\U0001F9FF])')
+_PUNCT_RE = re.compile(r'([!?.]){2,}')
+
+# All slang alternatives in one pattern so the whole map is applied in a
+# single scan of the text rather than one re.sub pass per entry
+_SLANG_MAP = {
+    'u': 'you',
+    'ur': 'your',
+    'thru': 'through',
+    'thx': 'thanks',
+    'plz': 'please',
+    'r': 'are',
+    '2': 'to',
+    '4': 'for',
+    '@': 'at',
+    '&': 'and',
+}
+_SLANG_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(key) for key in _SLANG_MAP) + r')\b',
+    re.IGNORECASE
+)
+
+
+def _replace_slang(match: "re.Match") -> str:
+    """Look up the expansion for a matched slang token."""
+    return _SLANG_MAP[match.group(1).lower()]
+
+
+# Smart quote -> ASCII rewrites in one C-level translate pass
+_QUOTE_TABLE = str.maketrans({
+    "“": '"',  # left double quotation mark
+    "”": '"',  # right double quotation mark
+    "‘": "'",  # left single quotation mark
+    "’": "'",  # right single quotation mark
+})
+
 
 class TextInputPlugin(BaseInputPlugin):
     """Text normalization and preprocessing plugin."""
@@ -42,37 +79,23 @@ class TextInputPlugin(BaseInputPlugin):
         """
         if not isinstance(content, str):
             content = str(content)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', content.strip())
-        
-        # Normalize emoji (keep but ensure proper spacing)
-        text = re.sub(r'([\U0001F300-\U0001F9FF])', r' \1 ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Normalize common slang/abbreviations
-        slang_map = {
-            r'\bu\b': 'you',
-            r'\bur\b': 'your',
-            r'\bthru\b': 'through',
-            r'\bthx\b': 'thanks',
-            r'\bplz\b': 'please',
-            r'\br\b': 'are',
-            r'\bu\b': 'you',
-            r'\b2\b': 'to',
-            r'\b4\b': 'for',
-            r'\b@\b': 'at',
-            r'\b&\b': 'and',
-        }
-        
-        for pattern, replacement in slang_map.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
+
+        # Normalize whitespace (split/join is faster than regex here)
+        text = " ".join(content.split())
+
+        # Normalize emoji (keep but ensure proper spacing) - only pay for
+        # the two substitution passes when emoji are actually present
+        if _EMOJI_RE.search(text):
+            text = _EMOJI_RE.sub(r' \1 ', text)
+            text = " ".join(text.split())
+
+        # Normalize common slang/abbreviations (single pass over the text)
+        text = _SLANG_RE.sub(_replace_slang, text)
+
         # Remove excessive punctuation (keep single instances)
-        text = re.sub(r'([!?.]){2,}', r'\1', text)
+        text = _PUNCT_RE.sub(r'\1', text)
         
         # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace("'", "'").replace("'", "'")
+        text = text.translate(_QUOTE_TABLE)
         
         return text.strip()
@@ -1,10 +1,12 @@
 """Video input processing plugin."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pathlib import Path
 
 from .base_input import BaseInputPlugin
+from ...core.executors import SHARED_EXECUTOR
 
 logger = logging.getLogger(__name__)
 
@@ -37,52 +39,73 @@ class VideoInputPlugin(BaseInputPlugin):
     
     async def process(self, content: Any, **kwargs) -> str:
         """Process video by extracting keyframes and analyzing them.
-        
+
         Args:
             content: Video data (bytes, file path, or video object)
             **kwargs: Additional options (frame_interval, etc.)
-            
+
         Returns:
             Video description text
         """
+        descriptions = [desc async for desc in self.stream(content, **kwargs)]
+        return "\n".join(descriptions)
+
+    async def stream(self, content: Any, **kwargs) -> AsyncIterator[str]:
+        """Stream per-frame captions as they are generated.
+
+        Yields captions batch by batch instead of materializing the whole
+        video's text, so downstream consumers get the first caption after
+        one batch and memory stays bounded for long videos.
+
+        Args:
+            content: Video data (bytes, file path, or video object)
+            **kwargs: Additional options (frame_interval, batch_size, etc.)
+
+        Yields:
+            Per-frame caption lines ("Frame Ns: ...")
+        """
         # Extract keyframes
-        frames = await self._extract_frames(content, kwargs.get("frame_interval", 30))
-        
+        interval = kwargs.get("frame_interval", 30)
+        frames = await self._extract_frames(content, interval)
+
         # Get image input plugin
         image_plugin = getattr(self, "image_input_plugin", None)
         if image_plugin is None:
             raise RuntimeError("Image input plugin not available")
-        
-        # Process each frame
-        descriptions = []
-        for i, frame in enumerate(frames):
-            frame_desc = await image_plugin.process(frame, use_heavy_model=False)
-            descriptions.append(f"Frame {i * kwargs.get('frame_interval', 30)}s: {frame_desc}")
-        
-        # Combine descriptions
-        return "\n".join(descriptions)
+
+        # Caption frames in small batches, yielding as each batch completes
+        batch_size = kwargs.get("batch_size", 8)
+        for start in range(0, len(frames), batch_size):
+            batch = frames[start:start + batch_size]
+            frame_descs = await image_plugin.process_batch(batch)
+            for i, frame_desc in enumerate(frame_descs):
+                yield f"Frame {(start + i) * interval}s: {frame_desc}"
     
     async def _extract_frames(self, content: Any, interval: int = 30) -> List[Any]:
         """Extract keyframes from video.
-        
+
         Args:
             content: Video content
             interval: Frame interval in seconds
-            
+
         Returns:
-            List of frame images
+            List of RGB frame arrays (HxWx3 uint8)
         """
         try:
             import cv2
+            import numpy as np
         except ImportError:
             logger.error("OpenCV not installed. Install with: pip install opencv-python")
             raise
         
         # Handle different input types
         if isinstance(content, bytes):
-            # Save to temp file
+            # Save to temp file so OpenCV can open a path. On Linux, prefer
+            # /dev/shm (tmpfs) so the blob never touches the disk.
+            import os
             import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as f:
+            temp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4", dir=temp_dir) as f:
                 f.write(content)
                 video_path = f.name
         elif isinstance(content, (str, Path)):
@@ -91,32 +114,48 @@ class VideoInputPlugin(BaseInputPlugin):
             raise ValueError(f"Unsupported video input type: {type(content)}")
         
         try:
-            # Open video
-            cap = cv2.VideoCapture(video_path)
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_interval_frames = int(fps * interval)
-            
-            frames = []
-            frame_count = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                if frame_count % frame_interval_frames == 0:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    from PIL import Image
-                    frame_image = Image.fromarray(frame_rgb)
-                    frames.append(frame_image)
-                
-                frame_count += 1
-            
-            cap.release()
-            return frames
-            
+            # Decode on the shared executor - cv2 releases the GIL, and the
+            # loop would otherwise block the event loop for the whole video
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                SHARED_EXECUTOR,
+                self._decode_frames,
+                video_path,
+                interval
+            )
+
         finally:
             # Cleanup temp file if created
             if isinstance(content, bytes) and Path(video_path).exists():
                 Path(video_path).unlink()
+
+    def _decode_frames(self, video_path: str, interval: int) -> List[Any]:
+        """Decode keyframes from a video file synchronously."""
+        import cv2
+        import numpy as np
+
+        cap = cv2.VideoCapture(video_path)
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_interval_frames = int(fps * interval)
+
+        frames = []
+        frame_count = 0
+        rgb_buffer = None  # Reused across frames to avoid per-frame allocation
+
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            if frame_count % frame_interval_frames == 0:
+                # Convert BGR to RGB into a preallocated buffer (single copy,
+                # no PIL round-trip - downstream processors accept ndarrays)
+                if rgb_buffer is None or rgb_buffer.shape != frame.shape:
+                    rgb_buffer = np.empty_like(frame)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
+                frames.append(rgb_buffer.copy())
+
+            frame_count += 1
+
+        cap.release()
+        return frames
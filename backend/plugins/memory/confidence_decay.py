@@ -1,10 +1,14 @@
 """Memory confidence decay plugin."""
 
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 from .base_memory import BaseMemoryPlugin
+from ._decay_kernel import decay_confidences
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,14 @@ class ConfidenceDecayPlugin(BaseMemoryPlugin):
         """Initialize plugin."""
         from ...core.config import get_config
         self.config = get_config()
+        # Flatten the config values used on every call to plain floats -
+        # the three-attribute pydantic chain is a measurable cost per entry
+        self._decay_rate = float(self.config.memory.decay_rate)
+        self._cleanup_threshold = float(self.config.memory.cleanup_threshold)
+        self._confidence_threshold = float(self.config.memory.confidence_threshold)
+        # Warm the compiled kernel with a length-1 call so the first real
+        # batch doesn't pay the JIT compile cost
+        decay_confidences(np.ones(1), np.zeros(1), np.full(1, self._decay_rate))
         logger.info("Confidence decay plugin initialized")
     
     async def cleanup(self) -> None:
@@ -58,18 +70,23 @@ class ConfidenceDecayPlugin(BaseMemoryPlugin):
         """Apply decay to a single memory entry."""
         payload = memory_entry.get("payload", {})
         confidence = payload.get("confidence", 0.5)
-        last_verified = payload.get("last_verified")
-        decay_rate = payload.get("decay_rate", self.config.memory.decay_rate)
-        
-        if not last_verified:
-            return memory_entry
-        
-        # Calculate time since last verification
-        try:
-            last_verified_dt = datetime.fromisoformat(last_verified)
-            days_since = (datetime.now() - last_verified_dt).days
-        except:
-            days_since = 0
+        decay_rate = payload.get("decay_rate", self._decay_rate)
+
+        # Prefer the integer Unix timestamp - one subtraction and divide,
+        # no datetime/timedelta allocations; fall back to parsing the ISO
+        # string for entries written before the timestamp field existed
+        last_verified_ts = payload.get("last_verified_ts")
+        if last_verified_ts is not None:
+            days_since = max(0, (int(time.time()) - last_verified_ts) // 86400)
+        else:
+            last_verified = payload.get("last_verified")
+            if not last_verified:
+                return memory_entry
+            try:
+                last_verified_dt = datetime.fromisoformat(last_verified)
+                days_since = (datetime.now() - last_verified_dt).days
+            except (ValueError, TypeError):
+                days_since = 0
         
         # Apply exponential decay
         new_confidence = confidence * (1 - decay_rate) ** days_since
@@ -79,20 +96,136 @@ class ConfidenceDecayPlugin(BaseMemoryPlugin):
         
         return memory_entry
     
+    @staticmethod
+    def _entry_timestamp(payload: Dict[str, Any], now_ts: int) -> int:
+        """Get an entry's last-verified time as Unix seconds."""
+        ts = payload.get("last_verified_ts")
+        if ts is not None:
+            return ts
+        last_verified = payload.get("last_verified")
+        if last_verified:
+            try:
+                return int(datetime.fromisoformat(last_verified).timestamp())
+            except (ValueError, TypeError):
+                pass
+        return now_ts
+
+    @staticmethod
+    def _batch_decay_arrays(confidences: np.ndarray, days: np.ndarray, rates: np.ndarray) -> np.ndarray:
+        """Apply exponential decay to confidence arrays in one vectorized pass.
+
+        Computes confidence * (1 - rate) ** days for every entry without a
+        Python-level loop.
+
+        Args:
+            confidences: Current confidence values
+            days: Days since each entry was last verified
+            rates: Per-entry decay rates
+
+        Returns:
+            Decayed confidence values, clipped at 0.0
+        """
+        return decay_confidences(confidences, days, rates)
+
     async def _batch_decay(self) -> Dict[str, Any]:
-        """Apply decay to all memories (background task)."""
+        """Apply decay to all stale memories (background task)."""
         # Get memory plugin
         memory_plugin = getattr(self, "vector_memory_plugin", None)
-        if memory_plugin is None:
+        if memory_plugin is None or memory_plugin.qdrant_client is None:
             return {"processed": 0, "removed": 0}
-        
-        # This would typically iterate through all memories
-        # For now, return summary
-        return {
-            "processed": 0,
-            "removed": 0,
-            "message": "Batch decay not fully implemented (requires memory iteration)"
-        }
+
+        from qdrant_client.models import (
+            FieldCondition, Filter, IsEmptyCondition, PayloadField, Range
+        )
+
+        client = memory_plugin.qdrant_client
+        collection = memory_plugin.collection_name
+
+        # Server-side filter: only entries at least a day stale can decay,
+        # so Qdrant never ships fresh points to us at all. Memory stays
+        # bounded to one scroll page regardless of collection size.
+        # Legacy points written before last_verified_ts existed only carry
+        # the ISO string - the key is absent entirely, so the second
+        # branch must be IsEmptyCondition (missing or null), not
+        # IsNullCondition (explicit null only). They still age out; the
+        # timestamp is recovered in _entry_timestamp.
+        now_ts = int(time.time())
+        stale_filter = Filter(should=[
+            FieldCondition(key="last_verified_ts", range=Range(lt=now_ts - 86400)),
+            IsEmptyCondition(is_empty=PayloadField(key="last_verified_ts"))
+        ])
+
+        processed = 0
+        removed = 0
+        offset = None
+        while True:
+            points, offset = await client.scroll(
+                collection_name=collection,
+                limit=1024,
+                offset=offset,
+                scroll_filter=stale_filter,
+                with_payload=True,
+                with_vectors=False
+            )
+            if points:
+                page_processed, page_removed = await self._decay_page(
+                    client, collection, points, now_ts
+                )
+                processed += page_processed
+                removed += page_removed
+            if offset is None:
+                break
+
+        return {"processed": processed, "removed": removed}
+
+    async def _decay_page(self, client, collection: str, points: List[Any],
+                          now_ts: int) -> Tuple[int, int]:
+        """Decay one scroll page of points and write the results back."""
+        from qdrant_client.models import SetPayload, SetPayloadOperation
+
+        # Structure-of-arrays layout: pull the fields into contiguous numpy
+        # arrays and decay the whole page in one vectorized pass instead of
+        # per-entry dict lookups and scalar math
+        default_rate = self._decay_rate
+        confidences = np.array(
+            [p.payload.get("confidence", 0.5) for p in points], dtype=np.float64
+        )
+        rates = np.array(
+            [p.payload.get("decay_rate", default_rate) for p in points], dtype=np.float64
+        )
+        timestamps = np.array(
+            [self._entry_timestamp(p.payload, now_ts) for p in points], dtype=np.int64
+        )
+        days = np.maximum((now_ts - timestamps) // 86400, 0)
+
+        new_confidences = self._batch_decay_arrays(confidences, days, rates)
+
+        # Write back changed entries and drop the ones below the cleanup
+        # threshold - one coalesced batch_update_points call per page
+        # instead of an awaited round trip per changed point
+        cleanup_threshold = self._cleanup_threshold
+        removed_ids = []
+        update_ops = []
+        processed = 0
+        for point, new_confidence in zip(points, new_confidences):
+            if new_confidence < cleanup_threshold:
+                removed_ids.append(point.id)
+                continue
+            if new_confidence != point.payload.get("confidence"):
+                update_ops.append(SetPayloadOperation(set_payload=SetPayload(
+                    payload={"confidence": float(new_confidence)},
+                    points=[point.id]
+                )))
+            processed += 1
+
+        if update_ops:
+            await client.batch_update_points(
+                collection_name=collection, update_operations=update_ops
+            )
+        if removed_ids:
+            await client.delete(collection_name=collection, points_selector=removed_ids)
+
+        return processed, len(removed_ids)
     
     def should_remove(self, memory_entry: Dict[str, Any]) -> bool:
         """Check if memory should be removed (low confidence).
@@ -105,7 +238,7 @@ class ConfidenceDecayPlugin(BaseMemoryPlugin):
         """
         payload = memory_entry.get("payload", {})
         confidence = payload.get("confidence", 0.5)
-        return confidence < self.config.memory.cleanup_threshold
+        return confidence < self._cleanup_threshold
     
     def should_deprioritize(self, memory_entry: Dict[str, Any]) -> bool:
         """Check if memory should be deprioritized.
@@ -118,4 +251,4 @@ class ConfidenceDecayPlugin(BaseMemoryPlugin):
         """
         payload = memory_entry.get("payload", {})
         confidence = payload.get("confidence", 0.5)
-        return confidence < self.config.memory.confidence_threshold
+        return confidence < self._confidence_threshold
@@ -1,8 +1,9 @@
 """Vector memory plugin using Qdrant."""
 
 import logging
+import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 from .base_memory import BaseMemoryPlugin
@@ -33,30 +34,65 @@ class VectorMemoryPlugin(BaseMemoryPlugin):
         self.qdrant_client = None
         self.collection_name = "memories"
         self.embedding_plugin = None
+        # Store coalescing: individual stores are queued and flushed in
+        # batches so embedding and upsert costs amortize across entries
+        self.max_batch = 32
+        self.max_latency_ms = 50
+        self._store_queue: Optional[asyncio.Queue] = None
+        self._store_task: Optional[asyncio.Task] = None
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """Initialize plugin."""
         try:
-            from qdrant_client import QdrantClient
-            from qdrant_client.models import Distance, VectorParams
-            
-            # Initialize Qdrant client
+            from qdrant_client import AsyncQdrantClient, QdrantClient
+            from qdrant_client.models import (
+                Distance,
+                ScalarQuantization,
+                ScalarQuantizationConfig,
+                ScalarType,
+                VectorParams,
+            )
+
+            # One-shot sync client just for collection setup; the async
+            # client below serves all request-path traffic
             qdrant_url = config.get("qdrant_url", "http://localhost:6333")
-            self.qdrant_client = QdrantClient(url=qdrant_url)
-            
+            setup_client = QdrantClient(url=qdrant_url)
+
             # Create collection if it doesn't exist
             try:
-                self.qdrant_client.get_collection(self.collection_name)
+                setup_client.get_collection(self.collection_name)
             except:
-                # Collection doesn't exist, create it
-                self.qdrant_client.create_collection(
+                # Collection doesn't exist, create it with int8-quantized
+                # vectors kept in RAM - quarters search memory bandwidth;
+                # retrieval rescores top candidates with fp32 for recall
+                setup_client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
                         size=384,  # BGE-small embedding size
                         distance=Distance.COSINE
+                    ),
+                    quantization_config=ScalarQuantization(
+                        scalar=ScalarQuantizationConfig(
+                            type=ScalarType.INT8,
+                            quantile=0.99,
+                            always_ram=True
+                        )
                     )
                 )
-            
+            setup_client.close()
+
+            # Async client with gRPC for the hot paths - REST calls on the
+            # sync client blocked the event loop for every store/search
+            self.qdrant_client = AsyncQdrantClient(url=qdrant_url, prefer_grpc=True)
+
+            # Dependencies are injected before initialize runs, so resolve
+            # the embedding plugin once instead of a getattr per call
+            self.embedding_plugin = getattr(self, "embedding_agent_plugin", None)
+
+            # Start the store coalescer
+            self._store_queue = asyncio.Queue()
+            self._store_task = asyncio.create_task(self._store_worker())
+
             logger.info(f"Vector memory plugin initialized (Qdrant: {qdrant_url})")
         except ImportError:
             logger.warning("Qdrant client not installed")
@@ -67,6 +103,21 @@ class VectorMemoryPlugin(BaseMemoryPlugin):
     
     async def cleanup(self) -> None:
         """Cleanup plugin resources."""
+        if self._store_task is not None:
+            self._store_task.cancel()
+            try:
+                await self._store_task
+            except asyncio.CancelledError:
+                pass
+            self._store_task = None
+        # Resolve anything still queued so callers blocked in
+        # _store_memory don't hang forever on an abandoned future
+        if self._store_queue is not None:
+            while not self._store_queue.empty():
+                _, _, _, future = self._store_queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+            self._store_queue = None
         logger.info("Vector memory plugin cleaned up")
     
     async def process(self, input_text: str, output_text: str = None, metadata: Dict[str, Any] = None, 
@@ -92,69 +143,123 @@ class VectorMemoryPlugin(BaseMemoryPlugin):
             raise ValueError(f"Unknown operation: {operation}")
     
     async def _store_memory(self, input_text: str, output_text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Store a memory entry."""
-        if self.qdrant_client is None:
+        """Store a memory entry (coalesced into a batch with concurrent stores)."""
+        if self.qdrant_client is None or self._store_queue is None:
             return {"stored": False, "error": "Qdrant not available"}
-        
-        # Get embedding plugin
-        if self.embedding_plugin is None:
-            self.embedding_plugin = getattr(self, "embedding_agent_plugin", None)
-        
+
         if self.embedding_plugin is None:
             return {"stored": False, "error": "Embedding plugin not available"}
-        
-        # Generate embedding for input
-        embedding = await self.embedding_plugin.process(input_text, normalize=True)
-        
-        # Convert to list
-        if hasattr(embedding, "tolist"):
-            vector = embedding.tolist()
-        else:
-            vector = embedding
-        
-        # Create memory entry
-        memory_id = str(uuid.uuid4())
-        confidence = metadata.get("confidence", 0.7) if metadata else 0.7
-        source = metadata.get("source", "inference") if metadata else "inference"
-        decay_rate = metadata.get("decay_rate", 0.02) if metadata else 0.02
-        
-        memory_entry = {
-            "id": memory_id,
-            "vector": vector,
-            "payload": {
-                "content": f"Input: {input_text}\nOutput: {output_text}" if output_text else input_text,
+
+        # Enqueue and wait for the coalescer to flush this entry
+        future = asyncio.get_running_loop().create_future()
+        await self._store_queue.put((input_text, output_text, metadata, future))
+        return await future
+
+    async def _store_worker(self) -> None:
+        """Drain queued stores into batched embedding + upsert calls.
+
+        Waits up to max_latency_ms after the first queued entry to collect
+        up to max_batch entries, so one embedding forward pass and one
+        Qdrant round trip cover the whole batch.
+        """
+        while True:
+            items = [await self._store_queue.get()]
+            try:
+                deadline = asyncio.get_running_loop().time() + self.max_latency_ms / 1000.0
+                while len(items) < self.max_batch:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(self._store_queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    results = await self._store_memory_batch(items)
+                except Exception as e:
+                    logger.error(f"Failed to store memory batch: {e}")
+                    results = [{"stored": False, "error": str(e)}] * len(items)
+
+                for (_, _, _, future), result in zip(items, results):
+                    if not future.done():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                # Cancelled mid-batch: entries already dequeued into this
+                # batch are no longer on the queue for cleanup to drain,
+                # so resolve their futures here before exiting
+                for _, _, _, future in items:
+                    if not future.done():
+                        future.cancel()
+                raise
+
+    async def _store_memory_batch(self, items: List[Tuple]) -> List[Dict[str, Any]]:
+        """Store a batch of memory entries with one embed and one upsert."""
+        from qdrant_client.models import PointStruct
+
+        # One embedding forward pass for the whole batch
+        texts = [input_text for input_text, _, _, _ in items]
+        embeddings = await self.embedding_plugin.process(texts, normalize=True)
+
+        # One timestamp per batch - formatting isoformat strings per entry
+        # (twice each) was measurable once stores started coalescing.
+        # Unix seconds are the canonical form for decay math; the ISO
+        # string is kept alongside for display and debugging.
+        now = datetime.now()
+        now_iso = now.isoformat()
+        now_ts = int(now.timestamp())
+
+        points = []
+        results = []
+        for (input_text, output_text, metadata, _), embedding in zip(items, embeddings):
+            # Convert to list
+            if hasattr(embedding, "tolist"):
+                vector = embedding.tolist()
+            else:
+                vector = embedding
+
+            # Create memory entry
+            memory_id = str(uuid.uuid4())
+            confidence = metadata.get("confidence", 0.7) if metadata else 0.7
+            source = metadata.get("source", "inference") if metadata else "inference"
+            decay_rate = metadata.get("decay_rate", 0.02) if metadata else 0.02
+
+            # No "content" field - it duplicated input/output byte for byte;
+            # retrieval synthesizes the combined form on read. Build the
+            # payload once and only add metadata keys that don't collide,
+            # so callers can't silently overwrite the reserved fields (the
+            # old spread-after-literal merge let them) and the dict isn't
+            # rebuilt for the merge.
+            payload = {
                 "input": input_text,
                 "output": output_text,
                 "confidence": confidence,
                 "source": source,
-                "last_verified": datetime.now().isoformat(),
+                "last_verified": now_iso,
+                "last_verified_ts": now_ts,
                 "decay_rate": decay_rate,
-                "created_at": datetime.now().isoformat(),
-                **metadata or {}
+                "created_at": now_iso,
             }
-        }
-        
-        # Store in Qdrant
-        try:
-            self.qdrant_client.upsert(
-                collection_name=self.collection_name,
-                points=[memory_entry]
-            )
-            return {"stored": True, "id": memory_id}
-        except Exception as e:
-            logger.error(f"Failed to store memory: {e}")
-            return {"stored": False, "error": str(e)}
+            if metadata:
+                payload.update(
+                    {k: v for k, v in metadata.items() if k not in payload}
+                )
+
+            # PointStruct directly - handing the client raw dicts makes it
+            # reflect over each one to build the same struct before encoding
+            points.append(PointStruct(id=memory_id, vector=vector, payload=payload))
+            results.append({"stored": True, "id": memory_id})
+
+        # Store the whole batch in one Qdrant round trip
+        await self.qdrant_client.upsert(
+            collection_name=self.collection_name,
+            points=points
+        )
+        return results
     
     async def _retrieve_memories(self, query: str, top_k: int = 5) -> Dict[str, Any]:
         """Retrieve relevant memories."""
-        if self.qdrant_client is None:
-            return {"memories": [], "count": 0}
-        
-        # Get embedding plugin
-        if self.embedding_plugin is None:
-            self.embedding_plugin = getattr(self, "embedding_agent_plugin", None)
-        
-        if self.embedding_plugin is None:
+        if self.qdrant_client is None or self.embedding_plugin is None:
             return {"memories": [], "count": 0}
         
         # Generate query embedding
@@ -166,27 +271,41 @@ class VectorMemoryPlugin(BaseMemoryPlugin):
         else:
             query_vector = query_embedding
         
-        # Search
+        # Search (oversample the quantized index, then rescore with fp32)
         try:
-            results = self.qdrant_client.search(
+            from qdrant_client.models import QuantizationSearchParams, SearchParams
+
+            results = await self.qdrant_client.search(
                 collection_name=self.collection_name,
                 query_vector=query_vector,
-                limit=top_k
+                limit=top_k,
+                search_params=SearchParams(
+                    quantization=QuantizationSearchParams(
+                        rescore=True,
+                        oversampling=2.0
+                    )
+                )
             )
             
-            # Format results
-            memories = [
-                {
+            # Format results, rebuilding the combined content form that is
+            # no longer stored (older entries may still carry it directly)
+            memories = []
+            for result in results:
+                payload = result.payload
+                output_text = payload.get("output")
+                if output_text:
+                    content = f"Input: {payload.get('input', '')}\nOutput: {output_text}"
+                else:
+                    content = payload.get("content") or payload.get("input", "")
+                memories.append({
                     "id": result.id,
-                    "content": result.payload.get("content", ""),
-                    "confidence": result.payload.get("confidence", 0.5),
+                    "content": content,
+                    "confidence": payload.get("confidence", 0.5),
                     "score": result.score,
-                    "metadata": {k: v for k, v in result.payload.items() 
+                    "metadata": {k: v for k, v in payload.items()
                                if k not in ["content", "confidence"]}
-                }
-                for result in results
-            ]
-            
+                })
+
             return {"memories": memories, "count": len(memories)}
         except Exception as e:
             logger.error(f"Failed to retrieve memories: {e}")
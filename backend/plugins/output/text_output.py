@@ -40,45 +40,19 @@ class TextOutputPlugin(BaseOutputPlugin):
             Text chunks
         """
         chunk_size = kwargs.get("chunk_size", 10)  # Words per chunk
-        
-        words = content.split()
-        
-        # Stream in chunks
-        for i in range(0, len(words), chunk_size):
-            chunk = " ".join(words[i:i + chunk_size])
-            if i + chunk_size < len(words):
-                chunk += " "
-            yield chunk
-        
-        # Format as markdown if requested
-        if kwargs.get("format_markdown", False):
-            # Simple markdown formatting (can be enhanced)
-            formatted = self._format_markdown(content)
-            yield formatted
-    
-    def _format_markdown(self, text: str) -> str:
-        """Format text as markdown."""
-        # Simple markdown formatting
-        # In production, would use a proper markdown library
-        lines = text.split("\n")
-        formatted_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                formatted_lines.append("")
-                continue
-            
-            # Headers
-            if line.startswith("#"):
-                formatted_lines.append(line)
-            # Lists
-            elif line.startswith("-") or line.startswith("*"):
-                formatted_lines.append(line)
-            # Code blocks
-            elif "`" in line:
-                formatted_lines.append(line)
-            else:
-                formatted_lines.append(line)
-        
-        return "\n".join(formatted_lines)
+
+        # Stream in chunks by slicing the original string at every Nth
+        # space instead of materializing a word list and re-joining it.
+        # (The old markdown pass re-yielded the entire content after the
+        # chunks, duplicating the output - removed.)
+        length = len(content)
+        pos = 0
+        while pos < length:
+            start = pos
+            for _ in range(chunk_size):
+                space = content.find(" ", pos)
+                if space == -1:
+                    pos = length
+                    break
+                pos = space + 1
+            yield content[start:pos]
@@ -2,177 +2,324 @@
 
 import re
 import logging
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import sqlglot
+    from sqlglot import exp as _sqlexp
+    _SQLGLOT_AVAILABLE = True
+except ImportError:
+    _SQLGLOT_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if _SQLGLOT_AVAILABLE:
+    # Write/DDL node types whose presence anywhere in the tree makes a
+    # query unsafe. Resolved via getattr because sqlglot has renamed a
+    # few of these across versions.
+    _WRITE_NODES = tuple(
+        node for node in (
+            getattr(_sqlexp, name, None)
+            for name in ("Insert", "Update", "Delete", "Drop", "Create",
+                         "Alter", "AlterTable", "TruncateTable", "Grant",
+                         "Command")
+        ) if node is not None
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_sql(sql: str) -> Optional[Dict[str, Any]]:
+    """Parse SQL once and extract every field the validator needs.
+
+    One sqlglot AST walk replaces the 6-10 regex scans the individual
+    methods used to make over the same string, and detects writes
+    structurally instead of by keyword match (no false positives from
+    keywords inside string literals). Memoized because validate/cost/
+    plan rounds hit the same query several times.
+
+    Returns None when sqlglot is not installed, the query does not
+    parse, or it contains more than one statement - callers fall back
+    to the regex path. The stacked-statement case matters: parse_one
+    would silently keep only the first statement, so "SELECT 1; DROP
+    TABLE users" would look like a bare SELECT here while the regex
+    scan over the whole string correctly rejects it.
+    """
+    if not _SQLGLOT_AVAILABLE:
+        return None
+
+    try:
+        statements = sqlglot.parse(sql)
+    except Exception:
+        return None
+    if len(statements) != 1 or statements[0] is None:
+        return None
+    tree = statements[0]
+
+    tables = [t.name.upper() for t in tree.find_all(_sqlexp.Table) if t.name]
+
+    columns: List[str] = []
+    select = tree if isinstance(tree, _sqlexp.Select) else tree.find(_sqlexp.Select)
+    if select is not None:
+        for expression in select.expressions:
+            if isinstance(expression, _sqlexp.Star):
+                columns = ["*"]
+                break
+            name = expression.alias_or_name
+            if name:
+                columns.append(name.upper())
+
+    limit_node = tree.find(_sqlexp.Limit)
+    limit = None
+    if limit_node is not None:
+        try:
+            limit = int(limit_node.expression.name)
+        except (AttributeError, TypeError, ValueError):
+            limit = None
+
+    # Node class names double as the reported keywords (TruncateTable
+    # -> TRUNCATE, AlterTable -> ALTER)
+    writes = sorted({
+        type(node).__name__.replace("Table", "").upper()
+        for node in tree.find_all(*_WRITE_NODES)
+    })
+
+    return {
+        "tables": tables,
+        "columns": columns,
+        "joins": sum(1 for _ in tree.find_all(_sqlexp.Join)),
+        "filters": sum(1 for _ in tree.find_all(_sqlexp.Where)),
+        "limit": limit,
+        "selects": sum(1 for _ in tree.find_all(_sqlexp.Select)),
+        "writes": writes,
+        "order_by": tree.find(_sqlexp.Order) is not None,
+        "is_select_only": isinstance(tree, _sqlexp.Select) and not writes,
+    }
+
 
 class SQLValidator:
     """Validates SQL queries for safety."""
-    
+
     def __init__(self):
         """Initialize SQL validator."""
         self.dangerous_keywords = [
             "DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "CREATE",
             "TRUNCATE", "EXEC", "EXECUTE", "GRANT", "REVOKE"
         ]
-    
+        self.write_keywords = [
+            "INSERT", "UPDATE", "DELETE", "DROP", "ALTER", "CREATE", "TRUNCATE"
+        ]
+
+        # Compile every pattern once - the validator runs on each SQL
+        # request, and per-call re.search on f-string patterns paid a
+        # cache lookup (and Python loop) per keyword. One alternation
+        # scans the query in a single pass. These are the fallback when
+        # sqlglot is unavailable or a query does not parse.
+        self._dangerous_re = re.compile(
+            r'\b(' + '|'.join(self.dangerous_keywords) + r')\b'
+        )
+        self._write_re = re.compile(
+            r'\b(?:' + '|'.join(self.write_keywords) + r')\b'
+        )
+        self._injection_re = re.compile(
+            r"(';.*--)|(';.*/\*)|(UNION.*SELECT)|(OR.*1.*=.*1)",
+            re.IGNORECASE
+        )
+        self._from_re = re.compile(r'FROM\s+(\w+)')
+        self._select_cols_re = re.compile(r'SELECT\s+(.*?)\s+FROM')
+        self._join_re = re.compile(r'\bJOIN\b')
+        self._where_re = re.compile(r'\bWHERE\b')
+        self._limit_re = re.compile(r'LIMIT\s+(\d+)')
+
+    @staticmethod
+    def _prep(sql: str) -> Tuple[str, str]:
+        """Normalize a query once for the regex scan helpers.
+
+        upper() allocates a string the size of the query, and the
+        validator methods used to each call it on the same SQL. Public
+        entry points prep once and thread the normalized form through.
+        """
+        return sql, sql.upper().strip()
+
     def validate_sql(self, sql: str) -> Dict[str, Any]:
         """Validate SQL syntax and structure.
-        
+
         Args:
             sql: SQL query string
-            
+
         Returns:
             Validation result with valid flag and errors
         """
         errors = []
-        
+
         # Basic syntax check
         if not sql or not sql.strip():
             return {
                 "valid": False,
                 "errors": ["Empty SQL query"]
             }
-        
-        sql_upper = sql.upper().strip()
-        
-        # Check for dangerous operations
-        for keyword in self.dangerous_keywords:
-            if re.search(rf'\b{keyword}\b', sql_upper):
+
+        sql, sql_upper = self._prep(sql)
+        parsed = _parse_sql(sql)
+
+        if parsed is not None:
+            # Structural write detection - no false positives from
+            # keywords inside string literals
+            for keyword in parsed["writes"]:
                 errors.append(f"Dangerous keyword detected: {keyword}")
-        
-        # Basic structure validation
-        if not sql_upper.startswith("SELECT"):
-            errors.append("Only SELECT queries are allowed")
-        
-        # Check for SQL injection patterns
-        injection_patterns = [
-            r"';.*--",
-            r"';.*/\*",
-            r"UNION.*SELECT",
-            r"OR.*1.*=.*1",
-        ]
-        
-        for pattern in injection_patterns:
-            if re.search(pattern, sql_upper, re.IGNORECASE):
-                errors.append(f"Potential SQL injection detected: {pattern}")
-        
+            if not parsed["is_select_only"] and not parsed["writes"]:
+                errors.append("Only SELECT queries are allowed")
+        else:
+            # Check for dangerous operations (one scan, deduplicated in order)
+            for keyword in dict.fromkeys(self._dangerous_re.findall(sql_upper)):
+                errors.append(f"Dangerous keyword detected: {keyword}")
+
+            # Basic structure validation
+            if not sql_upper.startswith("SELECT"):
+                errors.append("Only SELECT queries are allowed")
+
+        # Check for SQL injection patterns (single combined scan)
+        injection_match = self._injection_re.search(sql_upper)
+        if injection_match:
+            errors.append(f"Potential SQL injection detected: {injection_match.group(0)}")
+
         return {
             "valid": len(errors) == 0,
             "errors": errors,
-            "execution_plan": self._generate_execution_plan(sql) if len(errors) == 0 else {}
+            "execution_plan": self._generate_execution_plan(sql, sql_upper) if len(errors) == 0 else {}
         }
-    
+
     def check_allowlist(self, sql: str, allowlist: Dict[str, List[str]]) -> Dict[str, Any]:
         """Check if SQL only uses allowlisted tables and columns.
-        
+
         Args:
             sql: SQL query
             allowlist: Dictionary mapping table names to allowed columns
-            
+
         Returns:
             Allowlist check result
         """
         errors = []
-        
-        # Extract table names
-        table_pattern = r'FROM\s+(\w+)'
-        tables = re.findall(table_pattern, sql.upper())
-        
-        # Extract column names (simplified)
-        column_pattern = r'SELECT\s+(.*?)\s+FROM'
-        column_match = re.search(column_pattern, sql.upper())
-        
+        parsed = _parse_sql(sql)
+
+        if parsed is not None:
+            tables = parsed["tables"]
+            columns = [] if parsed["columns"] == ["*"] else parsed["columns"]
+        else:
+            sql, sql_upper = self._prep(sql)
+            tables = self._from_re.findall(sql_upper)
+            columns = []
+            column_match = self._select_cols_re.search(sql_upper)
+            if column_match:
+                columns_str = column_match.group(1)
+                if columns_str != "*":
+                    # Parse columns (simplified)
+                    columns = [col.strip() for col in columns_str.split(",")]
+
         # Check tables
         for table in tables:
             if table not in allowlist:
                 errors.append(f"Table '{table}' is not in allowlist")
-        
+
         # Check columns (if allowlist specifies columns)
-        if column_match:
-            columns_str = column_match.group(1)
-            if columns_str != "*":
-                # Parse columns (simplified)
-                columns = [col.strip() for col in columns_str.split(",")]
-                for table in tables:
-                    if table in allowlist:
-                        allowed_cols = allowlist[table]
-                        for col in columns:
-                            if "." in col:
-                                col = col.split(".")[-1]
-                            if col not in allowed_cols and "*" not in allowed_cols:
-                                errors.append(f"Column '{col}' is not allowed for table '{table}'")
-        
+        for table in tables:
+            if table in allowlist:
+                allowed_cols = allowlist[table]
+                for col in columns:
+                    if "." in col:
+                        col = col.split(".")[-1]
+                    if col not in allowed_cols and "*" not in allowed_cols:
+                        errors.append(f"Column '{col}' is not allowed for table '{table}'")
+
         return {
             "allowed": len(errors) == 0,
             "errors": errors
         }
-    
+
     def is_read_only(self, sql: str) -> bool:
         """Check if SQL is read-only.
-        
+
         Args:
             sql: SQL query
-            
+
         Returns:
             True if read-only
         """
-        sql_upper = sql.upper().strip()
-        
-        # Check for write operations
-        write_keywords = ["INSERT", "UPDATE", "DELETE", "DROP", "ALTER", "CREATE", "TRUNCATE"]
-        
-        for keyword in write_keywords:
-            if re.search(rf'\b{keyword}\b', sql_upper):
-                return False
-        
-        # Must start with SELECT
-        return sql_upper.startswith("SELECT")
-    
+        parsed = _parse_sql(sql)
+        if parsed is not None:
+            return parsed["is_select_only"]
+
+        sql, sql_upper = self._prep(sql)
+
+        # Must start with SELECT - a prefix check rejects most non-read
+        # queries for the cost of a few byte comparisons, before any scan
+        if not sql_upper.startswith("SELECT"):
+            return False
+
+        # One combined scan catches writes buried in an otherwise
+        # SELECT-shaped query (subqueries, stacked statements)
+        return self._write_re.search(sql_upper) is None
+
     def estimate_cost(self, sql: str) -> Dict[str, Any]:
         """Estimate query cost.
-        
+
         Args:
             sql: SQL query
-            
+
         Returns:
             Cost estimate
         """
         # Simple heuristics
         complexity = 1.0
-        
-        # Count joins
-        join_count = len(re.findall(r'\bJOIN\b', sql.upper()))
+        parsed = _parse_sql(sql)
+
+        if parsed is not None:
+            join_count = parsed["joins"]
+            subquery_count = max(0, parsed["selects"] - 1)
+            row_limit = parsed["limit"] if parsed["limit"] is not None else 1000
+        else:
+            sql, sql_upper = self._prep(sql)
+            join_count = len(self._join_re.findall(sql_upper))
+            subquery_count = sql_upper.count("SELECT") - 1
+            limit_match = self._limit_re.search(sql_upper)
+            row_limit = int(limit_match.group(1)) if limit_match else 1000
+
         complexity += join_count * 0.5
-        
-        # Count subqueries
-        subquery_count = sql.upper().count("SELECT") - 1
         complexity += subquery_count * 0.3
-        
-        # Estimate row limit (if specified)
-        limit_match = re.search(r'LIMIT\s+(\d+)', sql.upper())
-        row_limit = int(limit_match.group(1)) if limit_match else 1000
-        
+
         return {
             "complexity": complexity,
             "estimated_rows": min(row_limit, 10000),  # Cap at 10k
             "cost_score": complexity * (row_limit / 1000)
         }
-    
-    def _generate_execution_plan(self, sql: str) -> Dict[str, Any]:
+
+    def _generate_execution_plan(self, sql: str, sql_upper: Optional[str] = None) -> Dict[str, Any]:
         """Generate execution plan (simplified).
-        
+
         Args:
             sql: SQL query
-            
+            sql_upper: Normalized form from _prep, if the caller already
+                computed it
+
         Returns:
             Execution plan
         """
+        parsed = _parse_sql(sql)
+        if parsed is not None:
+            return {
+                "tables": parsed["tables"],
+                "joins": parsed["joins"],
+                "filters": parsed["filters"],
+                "order_by": parsed["order_by"],
+                "limit": parsed["limit"] is not None
+            }
+
+        if sql_upper is None:
+            sql, sql_upper = self._prep(sql)
         return {
-            "tables": re.findall(r'FROM\s+(\w+)', sql.upper()),
-            "joins": len(re.findall(r'\bJOIN\b', sql.upper())),
-            "filters": len(re.findall(r'\bWHERE\b', sql.upper())),
-            "order_by": "ORDER BY" in sql.upper(),
-            "limit": bool(re.search(r'LIMIT\s+(\d+)', sql.upper()))
+            "tables": self._from_re.findall(sql_upper),
+            "joins": len(self._join_re.findall(sql_upper)),
+            "filters": len(self._where_re.findall(sql_upper)),
+            "order_by": "ORDER BY" in sql_upper,
+            "limit": self._limit_re.search(sql_upper) is not None
         }
@@ -1,40 +1,79 @@
 """Streaming utilities."""
 
-from typing import AsyncIterator, Dict, Any
+from typing import AsyncIterator, Dict, Any, Union
 import json
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def format_streaming_chunk(chunk_type: str, content: Any, metadata: Dict[str, Any] = None) -> bytes:
+    """Format a streaming chunk as wire-ready JSON bytes.
+
+    Chunks are invariably serialized for SSE/WebSocket delivery, so
+    serialize here once with orjson (C-implemented, SIMD string
+    escaping) instead of handing a dict to stdlib json per token.
 
-async def format_streaming_chunk(chunk_type: str, content: Any, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-    """Format a streaming chunk.
-    
     Args:
         chunk_type: Chunk type (text, audio, council_update, error, done)
         content: Chunk content
         metadata: Optional metadata
-        
+
     Returns:
-        Formatted chunk dictionary
+        JSON-encoded chunk bytes
     """
-    return {
+    if _ORJSON_AVAILABLE:
+        if chunk_type == "text" and not metadata:
+            # Hot path: per-token text chunks share a constant envelope,
+            # only the content needs escaping
+            return (b'{"type":"text","content":'
+                    + orjson.dumps(content)
+                    + b',"metadata":{}}')
+        return orjson.dumps({
+            "type": chunk_type,
+            "content": content,
+            "metadata": metadata or {}
+        })
+    return json.dumps({
         "type": chunk_type,
         "content": content,
         "metadata": metadata or {}
-    }
+    }).encode()
 
 
-async def stream_text(text: str, chunk_size: int = 10) -> AsyncIterator[str]:
+async def stream_text(text: Union[str, AsyncIterator[str]], chunk_size: int = 10) -> AsyncIterator[str]:
     """Stream text in chunks.
-    
+
     Args:
-        text: Text to stream
-        chunk_size: Words per chunk
-        
+        text: Text to stream, or an async iterator of already-streamed
+            chunks (e.g. a token streamer), which is passed through as-is
+        chunk_size: Words per chunk (ignored for async iterators)
+
     Yields:
         Text chunks
     """
-    words = text.split()
-    for i in range(0, len(words), chunk_size):
-        chunk = " ".join(words[i:i + chunk_size])
-        if i + chunk_size < len(words):
-            chunk += " "
-        yield chunk
+    # Token streamers already produce incremental chunks - forward them
+    # instead of buffering the full response just to re-chunk it
+    if hasattr(text, "__aiter__"):
+        async for chunk in text:
+            yield chunk
+        return
+
+    # Chunks are contiguous substrings of the input, so slice the
+    # original string at every Nth space instead of materializing a word
+    # list and re-joining (plus re-appending the separator) per chunk -
+    # one allocation per chunk instead of O(chunk_size)
+    length = len(text)
+    pos = 0
+    while pos < length:
+        start = pos
+        for _ in range(chunk_size):
+            space = text.find(" ", pos)
+            if space == -1:
+                pos = length
+                break
+            pos = space + 1
+        yield text[start:pos]